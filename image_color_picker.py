@@ -10,23 +10,243 @@ Features:
 - 图像预览和缩放功能 / Image preview and zoom functionality
 - 鼠标点击获取像素颜色 / Mouse click to get pixel color
 - 显示RGB和HSV颜色值 / Display RGB and HSV color values
+
+Performance notes:
+- 主要开销受内存带宽限制：预览缩放（约 W·H·3 字节）和上传到PhotoImage（约 W·H·4 字节）
+  Hot paths are memory-bound: resizing the preview and uploading it to the PhotoImage
+- 优化优先减少搬运的字节数（可见区域渲染、缩放缓存），而不是单次取色的计算量
+  Optimize by moving fewer bytes (viewport rendering, zoom cache), not per-pick arithmetic
 """
 
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
-from PIL import Image, ImageTk, ImageGrab
-import colorsys
+from PIL import Image, ImageTk, ImageStat
 import os
-import json
-import csv
-import xml.etree.ElementTree as ET
-from datetime import datetime
-import sys
+import io
+import mmap
 import platform
 import threading
+import queue
+from concurrent.futures import Future
 import time
+import functools
+from array import array
+
+# 0-255对应的两位十六进制字符串，拼接颜色值时免去格式化开销
+HEX_TABLE = tuple(f"{i:02X}" for i in range(256))
+
+# 打开图像对话框的文件类型
+IMAGE_FILETYPES = (
+    ("所有支持的图像", "*.bmp;*.jpg;*.jpeg;*.png;*.gif;*.tiff;*.tif;*.webp;*.ico"),
+    ("BMP files", "*.bmp"),
+    ("JPEG files", "*.jpg;*.jpeg"),
+    ("PNG files", "*.png"),
+    ("GIF files", "*.gif"),
+    ("TIFF files", "*.tiff;*.tif"),
+    ("WebP files", "*.webp"),
+    ("Icon files", "*.ico"),
+    ("All files", "*.*")
+)
+
+# 各图像格式的说明
+FORMAT_TIPS = {
+    'BMP': '位图格式，无压缩，适合精确取色',
+    'JPEG': 'JPEG格式，有损压缩，颜色可能有轻微变化',
+    'PNG': 'PNG格式，无损压缩，支持透明度',
+    'GIF': 'GIF格式，调色板模式，颜色数量有限',
+    'TIFF': 'TIFF格式，高质量，支持多种色彩模式',
+    'WEBP': 'WebP格式，现代压缩格式',
+    'ICO': '图标格式，通常尺寸较小'
+}
+
+# 导出格式对应的保存对话框文件类型
+EXPORT_FILETYPES = {
+    'json': (("JSON files", "*.json"), ("All files", "*.*")),
+    'csv': (("CSV files", "*.csv"), ("All files", "*.*")),
+    'xml': (("XML files", "*.xml"), ("All files", "*.*")),
+    'txt': (("Text files", "*.txt"), ("All files", "*.*"))
+}
+
+def rgb_to_hsv_int(r, g, b):
+    """将0-255的RGB整数转换为HSV（色相为度，饱和度和明度为百分比）"""
+    # 用条件表达式代替max()/min()调用，省去函数调用开销
+    mx = r if r >= g and r >= b else (g if g >= b else b)
+    mn = r if r <= g and r <= b else (g if g <= b else b)
+    d = mx - mn
+    
+    v = mx * 100 // 255
+    s = d * 100 // mx if mx else 0
+    
+    # 直接在整数域计算色相，避免浮点除法
+    if d == 0:
+        h = 0
+    elif mx == r:
+        h = (g - b) * 60 // d % 360
+    elif mx == g:
+        h = (b - r) * 60 // d + 120
+    else:
+        h = (r - g) * 60 // d + 240
+    
+    return h, s, v
+
+@functools.lru_cache(maxsize=4096)
+def derive_color_values(rgb_int):
+    """由24位颜色值计算(十六进制, H, S, V)，结果按颜色缓存"""
+    # 连续点击同一纯色区域时直接命中缓存
+    r = (rgb_int >> 16) & 0xFF
+    g = (rgb_int >> 8) & 0xFF
+    b = rgb_int & 0xFF
+    return ("#" + HEX_TABLE[r] + HEX_TABLE[g] + HEX_TABLE[b],) + rgb_to_hsv_int(r, g, b)
+
+@functools.lru_cache(maxsize=None)
+def load_gdi_functions():
+    """加载Windows屏幕取色用的GDI函数 (GetDC, ReleaseDC, GetPixel)，只在第一次调用时声明类型"""
+    import ctypes
+    from ctypes import wintypes
+    # 声明参数和返回类型，否则64位系统上的HDC会按32位int传递而被截断
+    get_dc = ctypes.windll.user32.GetDC
+    get_dc.argtypes = (wintypes.HWND,)
+    get_dc.restype = wintypes.HDC
+    release_dc = ctypes.windll.user32.ReleaseDC
+    release_dc.argtypes = (wintypes.HWND, wintypes.HDC)
+    release_dc.restype = ctypes.c_int
+    get_pixel = ctypes.windll.gdi32.GetPixel
+    get_pixel.argtypes = (wintypes.HDC, ctypes.c_int, ctypes.c_int)
+    get_pixel.restype = wintypes.COLORREF
+    return get_dc, release_dc, get_pixel
+
+class ColorRecordStore:
+    """按列存储的颜色记录
+    
+    每个字段保存为一列紧凑数组，而不是每条记录一个嵌套字典，
+    长时间取色时内存占用小得多；导出时直接按列读取。
+    """
+    
+    __slots__ = (
+        'timestamps', 'xs', 'ys', 'rs', 'gs', 'bs', 'hs', 'ss', 'vs',
+        'hexes', 'file_ids', 'file_names', 'file_name_ids'
+    )
+    
+    def __init__(self):
+        self.clear()
+    
+    def clear(self):
+        """清空所有记录"""
+        self.timestamps = array('d')  # 取色时刻（Unix时间戳），导出时再格式化
+        self.xs = array('l')  # 屏幕取色时多显示器坐标可能为负
+        self.ys = array('l')
+        self.rs = array('B')
+        self.gs = array('B')
+        self.bs = array('B')
+        self.hs = array('H')
+        self.ss = array('B')
+        self.vs = array('B')
+        self.hexes = []
+        self.file_ids = array('I')  # 指向file_names的索引
+        self.file_names = []
+        self.file_name_ids = {}
+    
+    def __len__(self):
+        return len(self.timestamps)
+    
+    def append(self, timestamp, x, y, r, g, b, h, s, v, hex_color, image_file):
+        """追加一条记录"""
+        # 同一文件名只保存一次
+        file_id = self.file_name_ids.get(image_file)
+        if file_id is None:
+            file_id = len(self.file_names)
+            self.file_names.append(image_file)
+            self.file_name_ids[image_file] = file_id
+        
+        self.timestamps.append(timestamp)
+        self.xs.append(x)
+        self.ys.append(y)
+        self.rs.append(r)
+        self.gs.append(g)
+        self.bs.append(b)
+        self.hs.append(h)
+        self.ss.append(s)
+        self.vs.append(v)
+        self.hexes.append(hex_color)
+        self.file_ids.append(file_id)
+    
+    def formatted_timestamps(self):
+        """逐条生成格式化的时间字符串"""
+        # 连续取色的记录多在同一秒内，相同的秒只格式化一次
+        last_second = None
+        text = None
+        for timestamp in self.timestamps:
+            second = int(timestamp)
+            if second != last_second:
+                last_second = second
+                text = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(second))
+            yield text
+
+class DaemonWorker:
+    """单个后台守护线程，按提交顺序执行任务，submit返回Future
+    
+    用法与ThreadPoolExecutor(max_workers=1)相同，但线程为守护线程：
+    关闭窗口时进程不必等待正在解码的图像或截屏完成
+    """
+    
+    __slots__ = ('tasks', 'thread')
+    
+    def __init__(self):
+        self.tasks = queue.SimpleQueue()
+        self.thread = None
+    
+    def submit(self, func, *args):
+        """提交任务（第一次提交时才启动线程）"""
+        future = Future()
+        self.tasks.put((future, func, args))
+        if self.thread is None:
+            self.thread = threading.Thread(target=self.run, daemon=True)
+            self.thread.start()
+        return future
+    
+    def run(self):
+        """线程主循环"""
+        while True:
+            future, func, args = self.tasks.get()
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                future.set_result(func(*args))
+            except BaseException as e:
+                future.set_exception(e)
 
 class ImageColorPicker:
+    # 固定属性布局：取色时频繁访问的属性按偏移直接读取，不经过实例字典
+    __slots__ = (
+        # 窗口和界面配置
+        'root', 'ui_scale', 'spacing', 'fonts',
+        # 图像和显示状态
+        'image', 'photo', 'zoom_factor', 'zoom_var', 'canvas', 'canvas_image',
+        'display_image_obj', 'current_image_file', 'loading_file', 'load_executor',
+        'status_before_load',
+        'pick_image', 'pixel_access', 'last_pick_position',
+        'zoom_cache', 'last_photo_size', 'zoom_after_id', 'pending_zoom_factor',
+        'viewport_mode', 'viewport_tiles', 'viewport_after_id',
+        # 拖动取色
+        'last_drag_sample', 'pending_drag_event', 'drag_after_id',
+        # 颜色信息显示
+        'coord_label', 'r_label', 'g_label', 'b_label', 'hex_label',
+        'h_label', 's_label', 'v_label',
+        'coord_var', 'r_var', 'g_var', 'b_var', 'hex_var', 'h_var', 's_var', 'v_var',
+        'color_value_vars', 'color_preview', 'color_preview_rect',
+        'status_label', 'record_count_label',
+        # 颜色记录
+        'color_records',
+        # 悬浮取色窗口
+        'is_floating_mode', 'floating_btn', 'floating_window', 'floating_timer',
+        'floating_rgb_label', 'floating_hex_label', 'floating_color_preview',
+        'mouse_pos_label', 'screen_capture',
+        'last_floating_position', 'last_floating_color', 'last_floating_sample',
+        'notification_window', 'notification_label', 'notification_after_id',
+        'capture_executor', 'pending_capture', 'screen_size', 'floating_idle_ticks',
+        'min_grab_interval'
+    )
+    
     def __init__(self, root):
         self.root = root
         self.root.title("图像取色工具 - Image Color Picker")
@@ -37,6 +257,9 @@ class ImageColorPicker:
         # 计算界面缩放因子
         self.ui_scale = self.get_ui_scale_factor()
         
+        # 常用间距按缩放因子预先计算一次，布局时直接查表
+        self.spacing = {n: int(n * self.ui_scale) for n in (3, 4, 5, 8, 10, 15, 20)}
+        
         # 设置窗口大小（根据缩放调整）
         window_width = int(1400 * self.ui_scale)
         window_height = int(900 * self.ui_scale)
@@ -52,15 +275,54 @@ class ImageColorPicker:
         self.photo = None
         self.zoom_factor = 1.0
         self.canvas_image = None
+        self.display_image_obj = None
+        self.loading_file = None  # 正在后台加载的文件
+        self.status_before_load = None  # 加载失败时恢复的状态信息
+        self.load_executor = DaemonWorker()  # 后台读取和解码图像
+        self.last_drag_sample = 0.0  # 上次拖动取色的时间
+        self.pending_drag_event = None
+        self.drag_after_id = None
+        self.last_pick_position = None  # 上次取色的原始图像坐标
+        
+        # 取色缓存（加载图像时生成，避免每次点击都转换整幅图像）
+        self.pick_image = None
+        self.pixel_access = None
+        
+        # 缩放结果缓存（缩放因子 -> PhotoImage），按最近使用排序，加载新图像时清空
+        self.zoom_cache = {}
+        self.last_photo_size = None
+        self.zoom_after_id = None  # 延迟执行的缩放重绘
+        self.pending_zoom_factor = None  # 等待重绘的缩放比例，重绘前取色仍按当前显示的比例换算
+        
+        # 可见区域渲染（缩放结果过大时只渲染画布可见部分）
+        self.viewport_mode = False
+        self.viewport_tiles = {}  # (列, 行) -> (画布图像项, PhotoImage)
+        self.viewport_after_id = None
         
         # 颜色记录列表
-        self.color_records = []
+        self.color_records = ColorRecordStore()
         
         # 悬浮窗相关变量
         self.floating_window = None
         self.is_floating_mode = False
         self.screen_capture = None
         self.floating_timer = None
+        # 悬浮窗控件在 create_floating_window 中创建，取色循环只在其后运行
+        self.mouse_pos_label = None
+        self.floating_rgb_label = None
+        self.floating_hex_label = None
+        self.floating_color_preview = None
+        self.last_floating_position = None  # 上次显示的鼠标位置
+        self.last_floating_color = None  # 上次显示的颜色
+        self.last_floating_sample = None  # 上次读取的屏幕像素 (时间, x, y, 颜色)
+        self.notification_window = None  # 复用的取色成功通知窗口
+        self.notification_label = None
+        self.notification_after_id = None
+        self.capture_executor = DaemonWorker()  # 后台读取屏幕像素
+        self.pending_capture = None  # 正在后台读取的像素 (时间, x, y, future)
+        self.screen_size = None
+        self.floating_idle_ticks = 0  # 鼠标连续静止的检查次数
+        self.min_grab_interval = 0.0  # 两次读取屏幕像素的最短间隔（秒）
         
         # 配置样式
         self.setup_styles()
@@ -73,7 +335,6 @@ class ImageColorPicker:
             if platform.system() == "Windows":
                 # Windows DPI感知
                 import ctypes
-                from ctypes import wintypes
                 
                 # 设置DPI感知
                 try:
@@ -148,13 +409,13 @@ class ImageColorPicker:
         style.configure('Info.TLabel', font=self.fonts['default'])
         
         # 按钮样式
-        button_padding = (int(8 * self.ui_scale), int(4 * self.ui_scale))
+        button_padding = (self.spacing[8], self.spacing[4])
         style.configure('Custom.TButton', font=self.fonts['button'], padding=button_padding)
         
     def setup_ui(self):
         """设置用户界面"""
         # 主框架
-        padding = int(10 * self.ui_scale)
+        padding = self.spacing[10]
         main_frame = ttk.Frame(self.root)
         main_frame.pack(fill=tk.BOTH, expand=True, padx=padding, pady=padding)
         
@@ -163,13 +424,13 @@ class ImageColorPicker:
         control_frame.pack(fill=tk.X, pady=(0, padding))
         
         # 文件选择按钮
-        btn_padding = int(10 * self.ui_scale)
+        btn_padding = self.spacing[10]
         open_btn = ttk.Button(control_frame, text="选择图像文件", command=self.open_image, style='Custom.TButton')
         open_btn.pack(side=tk.LEFT, padx=(0, btn_padding))
         
         # 缩放控制
         zoom_label = ttk.Label(control_frame, text="缩放:", font=self.fonts['label'])
-        zoom_label.pack(side=tk.LEFT, padx=(0, int(5 * self.ui_scale)))
+        zoom_label.pack(side=tk.LEFT, padx=(0, self.spacing[5]))
         
         self.zoom_var = tk.StringVar(value="100%")
         combo_width = max(8, int(8 * self.ui_scale))
@@ -181,7 +442,11 @@ class ImageColorPicker:
         
         # 重置缩放按钮
         reset_btn = ttk.Button(control_frame, text="重置缩放", command=self.reset_zoom, style='Custom.TButton')
-        reset_btn.pack(side=tk.LEFT)
+        reset_btn.pack(side=tk.LEFT, padx=(0, self.spacing[5]))
+        
+        # 区域平均取色按钮
+        average_btn = ttk.Button(control_frame, text="区域平均(5x5)", command=self.average_region_color, style='Custom.TButton')
+        average_btn.pack(side=tk.LEFT)
         
         # 添加分隔符
         separator_padding = btn_padding
@@ -190,7 +455,7 @@ class ImageColorPicker:
         
         # 颜色记录管理按钮
         clear_btn = ttk.Button(control_frame, text="清空记录", command=self.clear_records, style='Custom.TButton')
-        clear_btn.pack(side=tk.LEFT, padx=(0, int(5 * self.ui_scale)))
+        clear_btn.pack(side=tk.LEFT, padx=(0, self.spacing[5]))
         
         export_btn = ttk.Button(control_frame, text="导出记录", command=self.export_records, style='Custom.TButton')
         export_btn.pack(side=tk.LEFT)
@@ -208,7 +473,7 @@ class ImageColorPicker:
         content_frame.pack(fill=tk.BOTH, expand=True)
         
         # 左侧：图像显示区域
-        left_padding = int(10 * self.ui_scale)
+        left_padding = self.spacing[10]
         left_frame = ttk.LabelFrame(content_frame, text="图像预览", padding=left_padding)
         left_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(0, padding))
         
@@ -223,7 +488,8 @@ class ImageColorPicker:
         v_scrollbar = ttk.Scrollbar(canvas_frame, orient=tk.VERTICAL, command=self.canvas.yview)
         h_scrollbar = ttk.Scrollbar(canvas_frame, orient=tk.HORIZONTAL, command=self.canvas.xview)
         
-        self.canvas.configure(yscrollcommand=v_scrollbar.set, xscrollcommand=h_scrollbar.set)
+        self.canvas.configure(yscrollcommand=lambda first, last: self.on_canvas_scroll(v_scrollbar, first, last),
+                              xscrollcommand=lambda first, last: self.on_canvas_scroll(h_scrollbar, first, last))
         
         # 布局滚动条和画布
         self.canvas.grid(row=0, column=0, sticky="nsew")
@@ -235,164 +501,257 @@ class ImageColorPicker:
         
         # 绑定鼠标事件
         self.canvas.bind("<Button-1>", self.on_canvas_click)
+        self.canvas.bind("<B1-Motion>", self.on_canvas_drag)
         
         # 右侧：颜色信息显示区域
         right_width = max(200, int(220 * self.ui_scale))
         right_frame = ttk.LabelFrame(content_frame, text="颜色信息", padding=left_padding)
-        right_frame.pack(side=tk.RIGHT, fill=tk.Y, ipadx=int(20 * self.ui_scale))
+        right_frame.pack(side=tk.RIGHT, fill=tk.Y, ipadx=self.spacing[20])
         right_frame.configure(width=right_width)
         
         # 当前像素坐标
         coord_title = ttk.Label(right_frame, text="像素坐标:", font=self.fonts['title'])
-        coord_title.pack(anchor=tk.W, pady=(0, int(5 * self.ui_scale)))
+        coord_title.pack(anchor=tk.W, pady=(0, self.spacing[5]))
         
-        self.coord_label = ttk.Label(right_frame, text="X: -, Y: -", font=self.fonts['default'])
-        self.coord_label.pack(anchor=tk.W, pady=(0, int(15 * self.ui_scale)))
+        self.coord_var = tk.StringVar(value="X: -, Y: -")
+        self.coord_label = ttk.Label(right_frame, textvariable=self.coord_var, font=self.fonts['default'])
+        self.coord_label.pack(anchor=tk.W, pady=(0, self.spacing[15]))
         
         # RGB值显示
         rgb_title = ttk.Label(right_frame, text="RGB值:", font=self.fonts['title'])
-        rgb_title.pack(anchor=tk.W, pady=(0, int(5 * self.ui_scale)))
+        rgb_title.pack(anchor=tk.W, pady=(0, self.spacing[5]))
         
         rgb_frame = ttk.Frame(right_frame)
-        rgb_frame.pack(fill=tk.X, pady=(0, int(10 * self.ui_scale)))
+        rgb_frame.pack(fill=tk.X, pady=(0, self.spacing[10]))
         
         # RGB标签布局
         label_font = self.fonts['default']
-        ttk.Label(rgb_frame, text="R:", font=label_font).grid(row=0, column=0, sticky=tk.W, padx=(0, int(5 * self.ui_scale)))
-        self.r_label = ttk.Label(rgb_frame, text="-", font=label_font)
-        self.r_label.grid(row=0, column=1, sticky=tk.W, padx=(0, int(15 * self.ui_scale)))
+        ttk.Label(rgb_frame, text="R:", font=label_font).grid(row=0, column=0, sticky=tk.W, padx=(0, self.spacing[5]))
+        self.r_var = tk.StringVar(value="-")
+        self.r_label = ttk.Label(rgb_frame, textvariable=self.r_var, font=label_font)
+        self.r_label.grid(row=0, column=1, sticky=tk.W, padx=(0, self.spacing[15]))
         
-        ttk.Label(rgb_frame, text="G:", font=label_font).grid(row=1, column=0, sticky=tk.W, padx=(0, int(5 * self.ui_scale)))
-        self.g_label = ttk.Label(rgb_frame, text="-", font=label_font)
-        self.g_label.grid(row=1, column=1, sticky=tk.W, padx=(0, int(15 * self.ui_scale)))
+        ttk.Label(rgb_frame, text="G:", font=label_font).grid(row=1, column=0, sticky=tk.W, padx=(0, self.spacing[5]))
+        self.g_var = tk.StringVar(value="-")
+        self.g_label = ttk.Label(rgb_frame, textvariable=self.g_var, font=label_font)
+        self.g_label.grid(row=1, column=1, sticky=tk.W, padx=(0, self.spacing[15]))
         
-        ttk.Label(rgb_frame, text="B:", font=label_font).grid(row=2, column=0, sticky=tk.W, padx=(0, int(5 * self.ui_scale)))
-        self.b_label = ttk.Label(rgb_frame, text="-", font=label_font)
-        self.b_label.grid(row=2, column=1, sticky=tk.W, padx=(0, int(15 * self.ui_scale)))
+        ttk.Label(rgb_frame, text="B:", font=label_font).grid(row=2, column=0, sticky=tk.W, padx=(0, self.spacing[5]))
+        self.b_var = tk.StringVar(value="-")
+        self.b_label = ttk.Label(rgb_frame, textvariable=self.b_var, font=label_font)
+        self.b_label.grid(row=2, column=1, sticky=tk.W, padx=(0, self.spacing[15]))
         
         # RGB十六进制值
         hex_title = ttk.Label(right_frame, text="十六进制:", font=self.fonts['title'])
-        hex_title.pack(anchor=tk.W, pady=(int(10 * self.ui_scale), int(5 * self.ui_scale)))
+        hex_title.pack(anchor=tk.W, pady=(self.spacing[10], self.spacing[5]))
         
-        self.hex_label = ttk.Label(right_frame, text="#------", font=self.fonts['default'])
-        self.hex_label.pack(anchor=tk.W, pady=(0, int(15 * self.ui_scale)))
+        self.hex_var = tk.StringVar(value="#------")
+        self.hex_label = ttk.Label(right_frame, textvariable=self.hex_var, font=self.fonts['default'])
+        self.hex_label.pack(anchor=tk.W, pady=(0, self.spacing[15]))
         
         # HSV值显示
         hsv_title = ttk.Label(right_frame, text="HSV值:", font=self.fonts['title'])
-        hsv_title.pack(anchor=tk.W, pady=(0, int(5 * self.ui_scale)))
+        hsv_title.pack(anchor=tk.W, pady=(0, self.spacing[5]))
         
         hsv_frame = ttk.Frame(right_frame)
-        hsv_frame.pack(fill=tk.X, pady=(0, int(10 * self.ui_scale)))
+        hsv_frame.pack(fill=tk.X, pady=(0, self.spacing[10]))
         
-        ttk.Label(hsv_frame, text="H:", font=label_font).grid(row=0, column=0, sticky=tk.W, padx=(0, int(5 * self.ui_scale)))
-        self.h_label = ttk.Label(hsv_frame, text="-", font=label_font)
+        ttk.Label(hsv_frame, text="H:", font=label_font).grid(row=0, column=0, sticky=tk.W, padx=(0, self.spacing[5]))
+        self.h_var = tk.StringVar(value="-")
+        self.h_label = ttk.Label(hsv_frame, textvariable=self.h_var, font=label_font)
         self.h_label.grid(row=0, column=1, sticky=tk.W)
         
-        ttk.Label(hsv_frame, text="S:", font=label_font).grid(row=1, column=0, sticky=tk.W, padx=(0, int(5 * self.ui_scale)))
-        self.s_label = ttk.Label(hsv_frame, text="-", font=label_font)
+        ttk.Label(hsv_frame, text="S:", font=label_font).grid(row=1, column=0, sticky=tk.W, padx=(0, self.spacing[5]))
+        self.s_var = tk.StringVar(value="-")
+        self.s_label = ttk.Label(hsv_frame, textvariable=self.s_var, font=label_font)
         self.s_label.grid(row=1, column=1, sticky=tk.W)
         
-        ttk.Label(hsv_frame, text="V:", font=label_font).grid(row=2, column=0, sticky=tk.W, padx=(0, int(5 * self.ui_scale)))
-        self.v_label = ttk.Label(hsv_frame, text="-", font=label_font)
+        ttk.Label(hsv_frame, text="V:", font=label_font).grid(row=2, column=0, sticky=tk.W, padx=(0, self.spacing[5]))
+        self.v_var = tk.StringVar(value="-")
+        self.v_label = ttk.Label(hsv_frame, textvariable=self.v_var, font=label_font)
         self.v_label.grid(row=2, column=1, sticky=tk.W)
         
+        # 取色时需要更新的数值变量（顺序与update_color_info中的文本对应）
+        self.color_value_vars = (
+            self.coord_var, self.r_var, self.g_var, self.b_var,
+            self.hex_var, self.h_var, self.s_var, self.v_var
+        )
+        
         # 颜色预览
         preview_title = ttk.Label(right_frame, text="颜色预览:", font=self.fonts['title'])
-        preview_title.pack(anchor=tk.W, pady=(int(15 * self.ui_scale), int(5 * self.ui_scale)))
+        preview_title.pack(anchor=tk.W, pady=(self.spacing[15], self.spacing[5]))
         
         preview_width = int(100 * self.ui_scale)
         preview_height = int(60 * self.ui_scale)
-        self.color_preview = tk.Frame(right_frame, width=preview_width, height=preview_height, 
-                                     bg="white", relief=tk.SUNKEN, bd=2)
-        self.color_preview.pack(pady=(0, int(15 * self.ui_scale)))
-        self.color_preview.pack_propagate(False)
+        # 用画布上的矩形显示颜色，取色时只需修改填充色，无需重新配置控件
+        self.color_preview = tk.Canvas(right_frame, width=preview_width, height=preview_height, 
+                                      bg="white", relief=tk.SUNKEN, bd=2, highlightthickness=0)
+        self.color_preview.pack(pady=(0, self.spacing[15]))
+        self.color_preview_rect = self.color_preview.create_rectangle(
+            0, 0, preview_width + 4, preview_height + 4, fill="white", outline=""
+        )
         
         # 状态标签
         self.status_label = ttk.Label(right_frame, text="请选择图像文件", 
                                      foreground="gray", font=self.fonts['small'])
-        self.status_label.pack(anchor=tk.W, pady=(int(20 * self.ui_scale), 0))
+        self.status_label.pack(anchor=tk.W, pady=(self.spacing[20], 0))
         
         # 颜色记录计数
         self.record_count_label = ttk.Label(right_frame, text="已记录颜色: 0", 
                                            foreground="blue", font=self.fonts['small'])
-        self.record_count_label.pack(anchor=tk.W, pady=(int(5 * self.ui_scale), 0))
+        self.record_count_label.pack(anchor=tk.W, pady=(self.spacing[5], 0))
         
     def open_image(self):
         """打开图像文件"""
         file_path = filedialog.askopenfilename(
             title="选择图像文件",
-            filetypes=[
-                ("所有支持的图像", "*.bmp;*.jpg;*.jpeg;*.png;*.gif;*.tiff;*.tif;*.webp;*.ico"),
-                ("BMP files", "*.bmp"),
-                ("JPEG files", "*.jpg;*.jpeg"),
-                ("PNG files", "*.png"),
-                ("GIF files", "*.gif"),
-                ("TIFF files", "*.tiff;*.tif"),
-                ("WebP files", "*.webp"),
-                ("Icon files", "*.ico"),
-                ("All files", "*.*")
-            ]
+            filetypes=IMAGE_FILETYPES
         )
         
         if file_path:
+            # 加载失败时之前的图像仍然可用，记下原来的状态信息以便恢复
+            if self.loading_file is None:
+                self.status_before_load = self.status_label.cget('text')
+            
+            # 在后台线程中读取和解码，避免大图像加载时界面卡顿
+            self.loading_file = file_path
+            self.status_label.config(text=f"正在加载: {os.path.basename(file_path)}...")
+            
+            future = self.load_executor.submit(self.load_image_worker, file_path)
+            self.root.after(50, self.check_image_loaded, file_path, future)
+    
+    def load_image_worker(self, file_path):
+        """后台线程：读取并解码图像（不能在此访问tkinter控件）
+        
+        返回 (图像, 取色用的RGB图像, 格式名称)
+        """
+        image = self.read_image_file(file_path)
+        format_name = image.format or "Unknown"
+        
+        # 立即解码像素数据，避免首次显示时在主线程中解码
+        image.load()
+        
+        # 转换为RGB模式以确保兼容性；无法转换的图像不能取色，按加载失败处理，保留当前图像
+        if image.mode not in ('RGB', 'RGBA'):
             try:
-                # 打开并验证图像
-                image = Image.open(file_path)
-                
-                # 检查图像格式并给出提示
-                format_name = image.format or "Unknown"
-                self.show_format_info(file_path, format_name)
-                
-                # 获取图像尺寸
-                width, height = image.size
-                
-                # 检查图像大小，如果太大则询问是否需要预处理
-                max_display_size = 4096  # 最大显示尺寸
-                if width > max_display_size or height > max_display_size:
-                    response = messagebox.askyesno(
-                        "大图像处理", 
-                        f"图像尺寸较大 ({width}x{height})，这可能影响性能。\n"
-                        f"建议的最大显示尺寸为 {max_display_size}x{max_display_size}。\n\n"
-                        "是否要创建预览版本以提高性能？\n"
-                        "（原始图像的取色精度不会受影响）"
-                    )
-                    if response:
-                        # 创建缩放版本用于显示
-                        display_image = self.create_display_version(image, max_display_size)
-                        self.image = image  # 保存原始图像用于精确取色
-                        self.display_image_obj = display_image  # 用于显示的图像
-                    else:
-                        self.image = image
-                        self.display_image_obj = image
-                else:
-                    self.image = image
-                    self.display_image_obj = image
-                
-                # 转换为RGB模式以确保兼容性
-                if self.image.mode not in ('RGB', 'RGBA'):
-                    try:
-                        self.image = self.image.convert('RGB')
-                        if hasattr(self, 'display_image_obj') and self.display_image_obj != self.image:
-                            self.display_image_obj = self.display_image_obj.convert('RGB')
-                    except Exception as e:
-                        messagebox.showwarning("转换警告", f"图像模式转换时出现问题: {str(e)}")
-                
-                self.current_image_file = os.path.basename(file_path)
-                self.zoom_factor = 1.0
-                self.zoom_var.set("100%")
-                self.display_image()
-                
-                # 更新状态信息
-                size_info = f"{width}x{height}"
-                if hasattr(self, 'display_image_obj') and self.display_image_obj != self.image:
-                    display_width, display_height = self.display_image_obj.size
-                    size_info += f" (显示: {display_width}x{display_height})"
-                
-                status_text = f"已加载: {os.path.basename(file_path)} ({size_info}) - {format_name}格式"
-                self.status_label.config(text=status_text)
-                
+                image = image.convert('RGB')
             except Exception as e:
-                messagebox.showerror("错误", f"无法打开图像文件:\n{str(e)}\n\n支持的格式: BMP, JPEG, PNG, GIF, TIFF, WebP, ICO")
+                raise ValueError(f"图像模式转换时出现问题: {e}") from e
+        
+        return image, self.create_pick_image(image), format_name
+    
+    def check_image_loaded(self, file_path, future):
+        """轮询后台加载结果，完成后在主线程中更新界面"""
+        # tkinter控件只能在主线程访问，因此轮询结果而不是在工作线程中回调
+        if not future.done():
+            self.root.after(50, self.check_image_loaded, file_path, future)
+            return
+        
+        # 加载期间又选择了其他文件，丢弃过期结果
+        if file_path != self.loading_file:
+            return
+        self.loading_file = None
+        
+        error = future.exception()
+        if error is not None:
+            self.status_label.config(text=self.status_before_load)
+            messagebox.showerror("错误", f"无法打开图像文件:\n{str(error)}\n\n支持的格式: BMP, JPEG, PNG, GIF, TIFF, WebP, ICO")
+            return
+        
+        try:
+            self.finish_image_load(file_path, *future.result())
+        except Exception as e:
+            self.status_label.config(text=self.status_before_load)
+            messagebox.showerror("错误", f"无法打开图像文件:\n{str(e)}\n\n支持的格式: BMP, JPEG, PNG, GIF, TIFF, WebP, ICO")
+    
+    def finish_image_load(self, file_path, image, pick_image, format_name):
+        """图像解码完成后设置状态并显示"""
+        # 检查图像格式并给出提示
+        self.show_format_info(file_path, format_name)
+        
+        # 获取图像尺寸
+        width, height = image.size
+        
+        # 检查图像大小，如果太大则询问是否需要预处理
+        max_display_size = 4096  # 最大显示尺寸
+        if width > max_display_size or height > max_display_size:
+            response = messagebox.askyesno(
+                "大图像处理", 
+                f"图像尺寸较大 ({width}x{height})，这可能影响性能。\n"
+                f"建议的最大显示尺寸为 {max_display_size}x{max_display_size}。\n\n"
+                "是否要创建预览版本以提高性能？\n"
+                "（原始图像的取色精度不会受影响）"
+            )
+            if response:
+                # 创建缩放版本用于显示
+                display_image = self.create_display_version(image, max_display_size)
+            else:
+                display_image = image
+        else:
+            display_image = image
+        
+        # 图像和取色用的像素访问对象一起更新，不会出现新图像配旧像素数据的情况
+        self.image = image  # 保存原始图像用于精确取色
+        self.display_image_obj = display_image  # 用于显示的图像
+        self.pick_image = pick_image
+        # load()返回的像素访问对象比getpixel少了每次调用的校验开销
+        self.pixel_access = pick_image.load()
+        self.last_pick_position = None
+        
+        self.current_image_file = os.path.basename(file_path)
+        self.reuse_base_photo()
+        self.last_photo_size = None
+        self.cancel_pending_zoom()
+        self.zoom_factor = 1.0
+        self.zoom_var.set("100%")
+        self.display_image()
+        
+        # 更新状态信息
+        size_info = f"{width}x{height}"
+        if self.display_image_obj is not self.image:
+            display_width, display_height = self.display_image_obj.size
+            size_info += f" (显示: {display_width}x{display_height})"
+        
+        status_text = f"已加载: {os.path.basename(file_path)} ({size_info}) - {format_name}格式"
+        self.status_label.config(text=status_text)
+    
+    def reuse_base_photo(self):
+        """清空缩放缓存；新图像与上一幅尺寸相同时保留100%的PhotoImage并原地更新像素"""
+        old_photo = self.zoom_cache.get(1.0)
+        self.zoom_cache.clear()
+        
+        # 连续打开同规格的图像（如一批1280x1024的BMP）时，直接粘贴新像素，
+        # 省去重新分配Tk图像；RGBA图像粘贴到RGB图像会丢失透明度，因此只处理RGB
+        display_img = self.display_image_obj
+        if (isinstance(old_photo, ImageTk.PhotoImage) and display_img.mode == 'RGB'
+                and (old_photo.width(), old_photo.height()) == display_img.size):
+            old_photo.paste(display_img)
+            self.zoom_cache[1.0] = old_photo
+    
+    def read_image_file(self, file_path):
+        """读取图像文件"""
+        # 映射到内存后一次读入，再交给PIL解码
+        # mmap超出末尾的seek会抛出ValueError，PIL识别格式时不会当作"不是该格式"处理，
+        # 因此不能直接传入mmap，需要包装为BytesIO
+        max_buffered_size = 256 * 1024 * 1024
+        if 0 < os.path.getsize(file_path) <= max_buffered_size:
+            with open(file_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return Image.open(io.BytesIO(mm))
+        
+        # 超大文件直接交给PIL按需读取，避免占用过多内存
+        return Image.open(file_path)
+    
+    def create_pick_image(self, image):
+        """生成取色用的RGB图像（在后台加载线程中调用）"""
+        # 加载时统一转换为RGB，取色时无需再按图像模式分别处理
+        if image.mode == 'RGB':
+            return image
+        if image.mode == 'RGBA':
+            # 透明像素预先与白色背景混合
+            pick_image = Image.new('RGB', image.size, (255, 255, 255))
+            pick_image.paste(image, mask=image.getchannel('A'))
+            return pick_image
+        return image.convert('RGB')
     
     def create_display_version(self, image, max_size):
         """创建用于显示的缩放版本"""
@@ -405,25 +764,16 @@ class ImageColorPicker:
             new_width = int(width * scale)
             new_height = int(height * scale)
             
-            # 使用高质量的缩放算法
-            display_image = image.resize((new_width, new_height), Image.Resampling.LANCZOS)
+            # 使用高质量的缩放算法；缩小倍数较大时先按整数倍块平均再做LANCZOS
+            # （与thumbnail相同的做法），但直接生成新图像，不必先复制一份原图
+            display_image = image.resize((new_width, new_height), Image.Resampling.LANCZOS, reducing_gap=3.0)
             return display_image
         
         return image
     
     def show_format_info(self, file_path, format_name):
         """显示图像格式信息"""
-        format_tips = {
-            'BMP': '位图格式，无压缩，适合精确取色',
-            'JPEG': 'JPEG格式，有损压缩，颜色可能有轻微变化',
-            'PNG': 'PNG格式，无损压缩，支持透明度',
-            'GIF': 'GIF格式，调色板模式，颜色数量有限',
-            'TIFF': 'TIFF格式，高质量，支持多种色彩模式',
-            'WEBP': 'WebP格式，现代压缩格式',
-            'ICO': '图标格式，通常尺寸较小'
-        }
-        
-        tip = format_tips.get(format_name, '未知格式')
+        tip = FORMAT_TIPS.get(format_name, '未知格式')
         
         # 如果不是BMP格式，显示提示信息
         if format_name != 'BMP':
@@ -436,7 +786,7 @@ class ImageColorPicker:
     
     def display_image(self):
         """显示图像到画布上"""
-        if not hasattr(self, 'display_image_obj') or self.display_image_obj is None:
+        if self.display_image_obj is None:
             return
         
         # 使用显示图像对象进行显示
@@ -447,51 +797,237 @@ class ImageColorPicker:
         new_width = int(original_width * self.zoom_factor)
         new_height = int(original_height * self.zoom_factor)
         
-        # 选择合适的重采样方法
-        if self.zoom_factor > 1.0:
-            # 放大时使用NEAREST保持像素锐利
-            resample_method = Image.Resampling.NEAREST
-        elif self.zoom_factor < 0.5:
-            # 大幅缩小时使用LANCZOS获得更好质量
-            resample_method = Image.Resampling.LANCZOS
-        else:
-            # 中等缩放使用BILINEAR平衡质量和性能
-            resample_method = Image.Resampling.BILINEAR
+        # 缩放结果过大时只渲染可见区域，避免生成数百MB的整幅图像
+        max_full_render_pixels = 16 * 1024 * 1024
+        if new_width * new_height > max_full_render_pixels:
+            # 缩放或图像变化后旧分块全部失效，整幅图像项也不再需要
+            self.clear_viewport_tiles()
+            if self.canvas_image is not None:
+                self.canvas.delete(self.canvas_image)
+                self.canvas_image = None
+            self.viewport_mode = True
+            self.last_photo_size = None
+            self.update_scroll_settings(new_width, new_height)
+            self.render_viewport()
+            return
+        self.viewport_mode = False
+        self.clear_viewport_tiles()
         
-        # 缩放图像
-        if self.zoom_factor != 1.0:
-            resized_image = display_img.resize((new_width, new_height), resample_method)
-        else:
-            resized_image = display_img
+        # 尺寸未变化时（如重复选择同一缩放级别）无需重建PhotoImage
+        if self.last_photo_size == (new_width, new_height):
+            return
         
-        # 转换为tkinter可用的格式
-        self.photo = ImageTk.PhotoImage(resized_image)
+        # 优先使用缓存，切换回用过的缩放级别时无需重新缩放和上传
+        photo = self.zoom_cache.pop(self.zoom_factor, None)
+        if photo is None and self.zoom_factor > 1.0 and self.zoom_factor.is_integer():
+            # 整数倍放大由Tk直接按像素复制原尺寸的PhotoImage，省去PIL缩放和再次上传
+            base_photo = self.zoom_cache.get(1.0)
+            if base_photo is None:
+                base_photo = ImageTk.PhotoImage(display_img)
+                self.zoom_cache[1.0] = base_photo
+            factor = int(self.zoom_factor)
+            photo = tk.PhotoImage(master=self.root, width=new_width, height=new_height)
+            photo.tk.call(photo, 'copy', base_photo, '-zoom', factor, factor)
+        elif photo is None:
+            # 缩放图像
+            shrink = 1 / self.zoom_factor
+            if shrink > 1 and shrink.is_integer():
+                # 整数倍缩小（50%、25%）按块求平均，结果与BOX相同（误差不超过1），但快数倍
+                factor = int(shrink)
+                resized_image = display_img.reduce(factor, box=(0, 0, new_width * factor, new_height * factor))
+            elif self.zoom_factor != 1.0:
+                resized_image = display_img.resize((new_width, new_height), self.get_resample_method())
+            else:
+                resized_image = display_img
+            
+            # 转换为tkinter可用的格式
+            photo = ImageTk.PhotoImage(resized_image)
+        self.photo = photo
+        
+        # 放到缓存末尾表示最近使用，超出上限时淘汰最久未用的缩放级别
+        self.zoom_cache[self.zoom_factor] = photo
+        self.trim_zoom_cache()
         
-        # 清除画布并显示图像
-        self.canvas.delete("all")
-        self.canvas_image = self.canvas.create_image(0, 0, anchor=tk.NW, image=self.photo)
+        self.last_photo_size = (new_width, new_height)
         
+        self.show_photo(0, 0)
+        self.update_scroll_settings(new_width, new_height)
+    
+    def trim_zoom_cache(self):
+        """限制缩放缓存占用的像素总量，按最近使用顺序淘汰"""
+        max_cached_pixels = 32 * 1024 * 1024  # 约128MB（每像素4字节）
+        cached_pixels = sum(photo.width() * photo.height() for photo in self.zoom_cache.values())
+        # 当前显示的级别在末尾，始终保留
+        while cached_pixels > max_cached_pixels and len(self.zoom_cache) > 1:
+            oldest = self.zoom_cache.pop(next(iter(self.zoom_cache)))
+            cached_pixels -= oldest.width() * oldest.height()
+    
+    def get_resample_method(self):
+        """选择合适的重采样方法（仅影响预览，取色始终读取原始图像）"""
+        if self.zoom_factor >= 1.0:
+            # 放大时使用NEAREST保持像素锐利
+            return Image.Resampling.NEAREST
+        # 缩小时使用BOX区域平均，速度快且不会产生NEAREST的噪点
+        return Image.Resampling.BOX
+    
+    def show_photo(self, x, y):
+        """将当前PhotoImage显示在画布的指定位置"""
+        # 复用已有的画布图像项，避免删除重建
+        if self.canvas_image is None:
+            self.canvas_image = self.canvas.create_image(x, y, anchor=tk.NW, image=self.photo)
+        else:
+            self.canvas.itemconfig(self.canvas_image, image=self.photo)
+            self.canvas.coords(self.canvas_image, x, y)
+    
+    def update_scroll_settings(self, width, height):
+        """更新画布滚动区域和滚动增量"""
         # 更新画布滚动区域
-        self.canvas.configure(scrollregion=self.canvas.bbox("all"))
+        self.canvas.configure(scrollregion=(0, 0, width, height))
         
         # 更新画布的滚动增量（根据缩放调整）
         scroll_increment = max(1, int(20 * self.zoom_factor))
         self.canvas.configure(xscrollincrement=scroll_increment, yscrollincrement=scroll_increment)
     
+    def on_canvas_scroll(self, scrollbar, first, last):
+        """画布视图变化（滚动、窗口大小改变）时同步滚动条"""
+        scrollbar.set(first, last)
+        
+        # 可见区域模式下需要补画新露出的部分，同一轮空闲时合并为一次
+        if self.viewport_mode and self.viewport_after_id is None:
+            self.viewport_after_id = self.root.after_idle(self.render_viewport)
+    
+    def render_viewport(self):
+        """按512像素分块渲染画布当前可见的区域（用于超大的缩放结果）"""
+        self.viewport_after_id = None
+        if not self.viewport_mode or self.display_image_obj is None:
+            return
+        
+        display_img = self.display_image_obj
+        zoom = self.zoom_factor
+        tile_size = 512
+        total_width = int(display_img.width * zoom)
+        total_height = int(display_img.height * zoom)
+        
+        # 计算可见区域覆盖的分块范围，四周各多留一块，小幅滚动时无需等待渲染
+        view_x0 = self.canvas.canvasx(0)
+        view_y0 = self.canvas.canvasy(0)
+        view_x1 = view_x0 + self.canvas.winfo_width()
+        view_y1 = view_y0 + self.canvas.winfo_height()
+        tx0 = max(0, int(view_x0 // tile_size) - 1)
+        ty0 = max(0, int(view_y0 // tile_size) - 1)
+        tx1 = min((total_width - 1) // tile_size, int(view_x1 // tile_size) + 1)
+        ty1 = min((total_height - 1) // tile_size, int(view_y1 // tile_size) + 1)
+        
+        # 离开范围的分块先留作备用，新分块尺寸相同时直接复用
+        tiles = self.viewport_tiles
+        spare_tiles = [tiles.pop(key) for key in list(tiles)
+                       if not (tx0 <= key[0] <= tx1 and ty0 <= key[1] <= ty1)]
+        
+        # 只为新露出的分块缩放和上传像素
+        resample = self.get_resample_method()
+        for ty in range(ty0, ty1 + 1):
+            for tx in range(tx0, tx1 + 1):
+                if (tx, ty) in tiles:
+                    continue
+                left, top = tx * tile_size, ty * tile_size
+                right = min(total_width, left + tile_size)
+                bottom = min(total_height, top + tile_size)
+                # 按浮点源区域缩放，相邻分块之间的像素与整幅缩放的结果对齐
+                region = display_img.resize((right - left, bottom - top), resample,
+                                            box=(left / zoom, top / zoom, right / zoom, bottom / zoom))
+                for index, (item, photo) in enumerate(spare_tiles):
+                    if (photo.width(), photo.height()) == region.size:
+                        # 原地粘贴像素并移动画布图像项，不必重新分配Tk图像和画布项
+                        del spare_tiles[index]
+                        photo.paste(region)
+                        self.canvas.coords(item, left, top)
+                        break
+                else:
+                    photo = ImageTk.PhotoImage(region)
+                    item = self.canvas.create_image(left, top, anchor=tk.NW, image=photo)
+                tiles[(tx, ty)] = (item, photo)
+        
+        # 没有用上的备用分块删除，释放对应的PhotoImage
+        for item, _ in spare_tiles:
+            self.canvas.delete(item)
+    
+    def clear_viewport_tiles(self):
+        """删除可见区域模式下渲染的全部分块"""
+        for item, _ in self.viewport_tiles.values():
+            self.canvas.delete(item)
+        self.viewport_tiles.clear()
+    
     def on_zoom_change(self, event):
         """处理缩放变化"""
         zoom_text = self.zoom_var.get()
-        self.zoom_factor = float(zoom_text.rstrip('%')) / 100.0
+        zoom_factor = float(zoom_text.rstrip('%')) / 100.0
+        
+        # 重新选择了目标缩放级别（有待执行的重绘时为其目标，否则为当前级别），无需重绘
+        target = self.pending_zoom_factor if self.pending_zoom_factor is not None else self.zoom_factor
+        if zoom_factor == target:
+            return
+        
+        # 合并短时间内的连续切换（如键盘上下键浏览），只重绘最后一次
+        self.cancel_pending_zoom()
+        if zoom_factor == self.zoom_factor:
+            # 切回了当前显示的级别
+            return
+        self.pending_zoom_factor = zoom_factor
+        self.zoom_after_id = self.root.after(80, self.apply_pending_zoom)
+    
+    def apply_pending_zoom(self):
+        """执行延迟的缩放重绘"""
+        # 缩放比例与画布内容同时更新，重绘前的点击和滚动仍按旧比例换算
+        self.zoom_factor = self.pending_zoom_factor
+        self.zoom_after_id = None
+        self.pending_zoom_factor = None
         self.display_image()
     
+    def cancel_pending_zoom(self):
+        """取消尚未执行的缩放重绘"""
+        if self.zoom_after_id:
+            self.root.after_cancel(self.zoom_after_id)
+            self.zoom_after_id = None
+        self.pending_zoom_factor = None
+    
     def reset_zoom(self):
         """重置缩放"""
-        self.zoom_factor = 1.0
+        if self.zoom_factor == 1.0 and self.pending_zoom_factor is None:
+            return
+        self.cancel_pending_zoom()
         self.zoom_var.set("100%")
-        self.display_image()
+        if self.zoom_factor != 1.0:
+            self.zoom_factor = 1.0
+            self.display_image()
     
     def on_canvas_click(self, event):
         """处理画布点击事件"""
+        self.pick_color_at(event)
+    
+    def on_canvas_drag(self, event):
+        """处理按住左键拖动取色（只更新显示，不添加记录）"""
+        # 总是保留最新的位置，已安排的取色会使用它，拖动停止时显示的就是最终位置
+        self.pending_drag_event = event
+        if self.drag_after_id is not None:
+            return
+        
+        # 限制采样频率，约每16毫秒最多取色一次：间隔未到时延后到期时再取色
+        remaining = 0.016 - (time.monotonic() - self.last_drag_sample)
+        if remaining > 0:
+            self.drag_after_id = self.root.after(max(1, round(remaining * 1000)), self.flush_drag_pick)
+        else:
+            self.drag_after_id = self.root.after_idle(self.flush_drag_pick)
+    
+    def flush_drag_pick(self):
+        """处理合并后的拖动取色"""
+        self.drag_after_id = None
+        self.last_drag_sample = time.monotonic()
+        event, self.pending_drag_event = self.pending_drag_event, None
+        if event is not None:
+            self.pick_color_at(event, record=False)
+    
+    def pick_color_at(self, event, record=True):
+        """获取鼠标事件位置的像素颜色并更新显示"""
         if self.image is None:
             return
         
@@ -500,7 +1036,7 @@ class ImageColorPicker:
         canvas_y = self.canvas.canvasy(event.y)
         
         # 如果使用了显示版本的图像，需要转换坐标
-        if hasattr(self, 'display_image_obj') and self.display_image_obj != self.image:
+        if self.display_image_obj is not self.image:
             # 计算从显示图像到原始图像的坐标映射
             display_width, display_height = self.display_image_obj.size
             original_width, original_height = self.image.size
@@ -523,84 +1059,63 @@ class ImageColorPicker:
         # 检查坐标是否在原始图像范围内
         width, height = self.image.size
         if 0 <= original_x < width and 0 <= original_y < height:
-            # 从原始图像获取像素颜色
-            pixel_color = self.image.getpixel((original_x, original_y))
-            
-            # 处理不同的图像模式
-            if self.image.mode == 'RGB':
-                r, g, b = pixel_color
-            elif self.image.mode == 'RGBA':
-                r, g, b, a = pixel_color
-                # 处理透明度，将其与白色背景混合
-                alpha = a / 255.0
-                r = int(r * alpha + 255 * (1 - alpha))
-                g = int(g * alpha + 255 * (1 - alpha))
-                b = int(b * alpha + 255 * (1 - alpha))
-            elif self.image.mode == 'L':  # 灰度图像
-                r = g = b = pixel_color
-            elif self.image.mode == 'P':  # 调色板模式（如GIF）
-                # 转换为RGB模式获取颜色
-                rgb_image = self.image.convert('RGB')
-                r, g, b = rgb_image.getpixel((original_x, original_y))
-            else:
-                # 其他模式，尝试转换到RGB
-                try:
-                    rgb_image = self.image.convert('RGB')
-                    r, g, b = rgb_image.getpixel((original_x, original_y))
-                except Exception as e:
-                    messagebox.showerror("错误", f"无法获取该位置的颜色: {str(e)}")
-                    return
+            # 从缓存的RGB像素访问对象获取颜色
+            r, g, b = self.pixel_access[original_x, original_y]
             
             # 更新显示（使用原始坐标）
-            self.update_color_info(original_x, original_y, r, g, b)
+            self.last_pick_position = (original_x, original_y)
+            self.update_color_info(original_x, original_y, r, g, b, record)
     
-    def update_color_info(self, x, y, r, g, b):
-        """更新颜色信息显示"""
-        # 更新坐标
-        self.coord_label.config(text=f"X: {x}, Y: {y}")
-        
-        # 更新RGB值
-        self.r_label.config(text=f"{r}")
-        self.g_label.config(text=f"{g}")
-        self.b_label.config(text=f"{b}")
+    def average_region_color(self):
+        """计算上次取色位置周围5x5区域的平均颜色"""
+        if self.image is None or self.last_pick_position is None:
+            messagebox.showinfo("提示", "请先在图像上点击取色")
+            return
         
-        # 更新十六进制值
-        hex_color = f"#{r:02X}{g:02X}{b:02X}"
-        self.hex_label.config(text=hex_color)
+        x, y = self.last_pick_position
+        radius = 2
+        width, height = self.pick_image.size
+        box = (max(0, x - radius), max(0, y - radius),
+               min(width, x + radius + 1), min(height, y + radius + 1))
+        region = self.pick_image.crop(box)
         
-        # 计算HSV值
-        h, s, v = colorsys.rgb_to_hsv(r/255.0, g/255.0, b/255.0)
-        h_deg = int(h * 360)
-        s_percent = int(s * 100)
-        v_percent = int(v * 100)
+        # 由ImageStat在C层统计各通道均值，先平均RGB再换算HSV（色相不能直接平均）
+        r, g, b = (int(round(c)) for c in ImageStat.Stat(region).mean)
+        self.update_color_info(x, y, r, g, b)
+    
+    def update_color_info(self, x, y, r, g, b, record=True):
+        """更新颜色信息显示"""
+        # 十六进制值和HSV值
+        hex_color, h_deg, s_percent, v_percent = derive_color_values((r << 16) | (g << 8) | b)
         
-        # 更新HSV值
-        self.h_label.config(text=f"{h_deg}°")
-        self.s_label.config(text=f"{s_percent}%")
-        self.v_label.config(text=f"{v_percent}%")
+        # 通过绑定的变量更新坐标、RGB、十六进制和HSV标签
+        texts = (
+            f"X: {x}, Y: {y}", str(r), str(g), str(b),
+            hex_color, f"{h_deg}°", f"{s_percent}%", f"{v_percent}%"
+        )
+        for var, text in zip(self.color_value_vars, texts):
+            var.set(text)
         
         # 更新颜色预览
-        self.color_preview.config(bg=hex_color)
+        self.color_preview.itemconfig(self.color_preview_rect, fill=hex_color)
         
         # 更新状态
         self.status_label.config(text=f"颜色: RGB({r},{g},{b}) HSV({h_deg}°,{s_percent}%,{v_percent}%)")
         
         # 添加到颜色记录
-        self.add_color_record(x, y, r, g, b, h_deg, s_percent, v_percent, hex_color)
+        if record:
+            self.add_color_record(x, y, r, g, b, h_deg, s_percent, v_percent, hex_color)
     
-    def add_color_record(self, x, y, r, g, b, h, s, v, hex_color):
+    def add_color_record(self, x, y, r, g, b, h, s, v, hex_color, image_file=None):
         """添加颜色记录"""
-        record = {
-            'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-            'sequence': len(self.color_records) + 1,
-            'position': {'x': x, 'y': y},
-            'rgb': {'r': r, 'g': g, 'b': b},
-            'hsv': {'h': h, 's': s, 'v': v},
-            'hex': hex_color,
-            'image_file': getattr(self, 'current_image_file', 'Unknown')
-        }
+        if image_file is None:
+            image_file = getattr(self, 'current_image_file', 'Unknown')
         
-        self.color_records.append(record)
+        # 只保存时间戳，格式化留到导出时进行
+        self.color_records.append(
+            time.time(),
+            x, y, r, g, b, h, s, v, hex_color, image_file
+        )
         self.update_record_count()
     
     def update_record_count(self):
@@ -646,18 +1161,18 @@ class ImageColorPicker:
         ))
         
         # 主框架
-        padding = int(15 * self.ui_scale)
+        padding = self.spacing[15]
         main_frame = ttk.Frame(export_window, padding=padding)
         main_frame.pack(fill=tk.BOTH, expand=True)
         
         # 标题
         title_label = ttk.Label(main_frame, text="选择导出格式", font=self.fonts['title'])
-        title_label.pack(pady=(0, int(20 * self.ui_scale)))
+        title_label.pack(pady=(0, self.spacing[20]))
         
         # 格式选择框架
-        format_padding = int(10 * self.ui_scale)
+        format_padding = self.spacing[10]
         format_frame = ttk.LabelFrame(main_frame, text="文件格式", padding=format_padding)
-        format_frame.pack(fill=tk.BOTH, expand=True, pady=(0, int(20 * self.ui_scale)))
+        format_frame.pack(fill=tk.BOTH, expand=True, pady=(0, self.spacing[20]))
         
         # 格式选择
         format_var = tk.StringVar(value="json")
@@ -669,8 +1184,8 @@ class ImageColorPicker:
             ("文本格式", "txt", "简单的文本列表格式")
         ]
         
-        option_spacing = int(3 * self.ui_scale)
-        desc_padding = int(20 * self.ui_scale)
+        option_spacing = self.spacing[3]
+        desc_padding = self.spacing[20]
         
         for name, value, desc in formats:
             option_frame = ttk.Frame(format_frame)
@@ -686,7 +1201,7 @@ class ImageColorPicker:
         # 信息显示
         info_text = f"当前共有 {len(self.color_records)} 条颜色记录"
         info_label = ttk.Label(main_frame, text=info_text, foreground="blue", font=self.fonts['default'])
-        info_label.pack(pady=(0, int(20 * self.ui_scale)))
+        info_label.pack(pady=(0, self.spacing[20]))
         
         # 按钮框架
         button_frame = ttk.Frame(main_frame)
@@ -714,23 +1229,15 @@ class ImageColorPicker:
     
     def save_records(self, format_type):
         """保存颜色记录到文件"""
-        # 文件类型映射
-        file_types = {
-            'json': [("JSON files", "*.json"), ("All files", "*.*")],
-            'csv': [("CSV files", "*.csv"), ("All files", "*.*")],
-            'xml': [("XML files", "*.xml"), ("All files", "*.*")],
-            'txt': [("Text files", "*.txt"), ("All files", "*.*")]
-        }
-        
         # 默认文件名
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        timestamp = time.strftime('%Y%m%d_%H%M%S')
         default_name = f"color_records_{timestamp}.{format_type}"
         
         # 选择保存位置
         file_path = filedialog.asksaveasfilename(
             title="保存颜色记录",
             defaultextension=f".{format_type}",
-            filetypes=file_types[format_type],
+            filetypes=EXPORT_FILETYPES[format_type],
             initialfile=default_name
         )
         
@@ -752,22 +1259,54 @@ class ImageColorPicker:
     
     def export_to_json(self, file_path):
         """导出为JSON格式"""
-        export_data = {
-            'export_info': {
-                'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-                'total_records': len(self.color_records),
-                'tool_version': '1.0',
-                'format': 'JSON'
-            },
-            'color_records': self.color_records
+        import json  # 仅导出时用到，延迟导入以加快启动
+        
+        export_info = {
+            'timestamp': time.strftime('%Y-%m-%d %H:%M:%S'),
+            'total_records': len(self.color_records),
+            'tool_version': '1.0',
+            'format': 'JSON'
         }
         
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(export_data, f, ensure_ascii=False, indent=2)
+        # 逐条写出记录，不在内存中构建完整的记录列表
+        # 输出格式与 json.dump(..., indent=2) 完全一致
+        with open(file_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+            info_text = json.dumps(export_info, ensure_ascii=False, indent=2).replace('\n', '\n  ')
+            f.write('{\n  "export_info": ' + info_text + ',\n  "color_records": [')
+            
+            # 记录结构固定，按模板直接生成文本，只有字符串字段交给JSON编码器转义
+            # json.dumps在indent模式下无法使用C加速，逐条编码字典很慢
+            encode = json.JSONEncoder(ensure_ascii=False).encode
+            template = (
+                '{{\n      "timestamp": {},\n      "sequence": {},\n'
+                '      "position": {{\n        "x": {},\n        "y": {}\n      }},\n'
+                '      "rgb": {{\n        "r": {},\n        "g": {},\n        "b": {}\n      }},\n'
+                '      "hsv": {{\n        "h": {},\n        "s": {},\n        "v": {}\n      }},\n'
+                '      "hex": {},\n      "image_file": {}\n    }}'
+            ).format
+            records = self.color_records
+            file_names = [encode(name) for name in records.file_names]
+            
+            separator = '\n    '
+            for i, (timestamp, x, y, r, g, b, h, s, v, hex_color, file_id) in enumerate(zip(
+                    records.formatted_timestamps(), records.xs, records.ys,
+                    records.rs, records.gs, records.bs,
+                    records.hs, records.ss, records.vs,
+                    records.hexes, records.file_ids), 1):
+                f.write(separator + template(
+                    encode(timestamp), i, x, y, r, g, b, h, s, v,
+                    encode(hex_color), file_names[file_id]
+                ))
+                separator = ',\n    '
+            
+            f.write('\n  ]\n}' if self.color_records else ']\n}')
     
     def export_to_csv(self, file_path):
         """导出为CSV格式"""
-        with open(file_path, 'w', newline='', encoding='utf-8-sig') as f:
+        import csv
+        
+        # 使用1MB缓冲区，减少大量记录导出时的系统调用次数
+        with open(file_path, 'w', newline='', encoding='utf-8-sig', buffering=1 << 20) as f:
             writer = csv.writer(f)
             
             # 写入表头
@@ -778,83 +1317,91 @@ class ImageColorPicker:
             ]
             writer.writerow(headers)
             
-            # 写入数据
-            for record in self.color_records:
-                row = [
-                    record['sequence'],
-                    record['timestamp'],
-                    record['image_file'],
-                    record['position']['x'],
-                    record['position']['y'],
-                    record['rgb']['r'],
-                    record['rgb']['g'],
-                    record['rgb']['b'],
-                    record['hex'],
-                    record['hsv']['h'],
-                    record['hsv']['s'],
-                    record['hsv']['v']
-                ]
-                writer.writerow(row)
+            # 写入数据：直接按列组合成行，由csv模块一次写出
+            records = self.color_records
+            file_names = records.file_names
+            writer.writerows(zip(
+                range(1, len(records) + 1),
+                records.formatted_timestamps(),
+                (file_names[i] for i in records.file_ids),
+                records.xs, records.ys,
+                records.rs, records.gs, records.bs,
+                records.hexes,
+                records.hs, records.ss, records.vs
+            ))
     
     def export_to_xml(self, file_path):
         """导出为XML格式"""
-        root = ET.Element('ColorRecords')
-        
-        # 添加导出信息
-        export_info = ET.SubElement(root, 'ExportInfo')
-        ET.SubElement(export_info, 'Timestamp').text = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        ET.SubElement(export_info, 'TotalRecords').text = str(len(self.color_records))
-        ET.SubElement(export_info, 'ToolVersion').text = '1.0'
-        ET.SubElement(export_info, 'Format').text = 'XML'
-        
-        # 添加颜色记录
-        records_elem = ET.SubElement(root, 'Records')
-        
-        for record in self.color_records:
-            record_elem = ET.SubElement(records_elem, 'ColorRecord')
-            record_elem.set('sequence', str(record['sequence']))
-            
-            ET.SubElement(record_elem, 'Timestamp').text = record['timestamp']
-            ET.SubElement(record_elem, 'ImageFile').text = record['image_file']
-            
-            position_elem = ET.SubElement(record_elem, 'Position')
-            ET.SubElement(position_elem, 'X').text = str(record['position']['x'])
-            ET.SubElement(position_elem, 'Y').text = str(record['position']['y'])
-            
-            rgb_elem = ET.SubElement(record_elem, 'RGB')
-            ET.SubElement(rgb_elem, 'R').text = str(record['rgb']['r'])
-            ET.SubElement(rgb_elem, 'G').text = str(record['rgb']['g'])
-            ET.SubElement(rgb_elem, 'B').text = str(record['rgb']['b'])
-            ET.SubElement(rgb_elem, 'Hex').text = record['hex']
+        from xml.sax.saxutils import escape
+        
+        # 记录结构固定，按模板逐条生成文本，只对字符串字段做转义，不构建元素树
+        # 输出格式与 ET.indent + tree.write 的结果一致
+        template = (
+            '    <ColorRecord sequence="{}">\n'
+            '      <Timestamp>{}</Timestamp>\n'
+            '      <ImageFile>{}</ImageFile>\n'
+            '      <Position>\n        <X>{}</X>\n        <Y>{}</Y>\n      </Position>\n'
+            '      <RGB>\n        <R>{}</R>\n        <G>{}</G>\n        <B>{}</B>\n'
+            '        <Hex>{}</Hex>\n      </RGB>\n'
+            '      <HSV>\n        <H>{}</H>\n        <S>{}</S>\n        <V>{}</V>\n      </HSV>\n'
+            '    </ColorRecord>\n'
+        ).format
+        records = self.color_records
+        file_names = [escape(name) for name in records.file_names]
+        
+        with open(file_path, 'w', encoding='utf-8', errors='xmlcharrefreplace', buffering=1 << 20) as f:
+            f.write(
+                "<?xml version='1.0' encoding='utf-8'?>\n"
+                "<ColorRecords>\n"
+                "  <ExportInfo>\n"
+                f"    <Timestamp>{time.strftime('%Y-%m-%d %H:%M:%S')}</Timestamp>\n"
+                f"    <TotalRecords>{len(records)}</TotalRecords>\n"
+                "    <ToolVersion>1.0</ToolVersion>\n"
+                "    <Format>XML</Format>\n"
+                "  </ExportInfo>\n"
+            )
             
-            hsv_elem = ET.SubElement(record_elem, 'HSV')
-            ET.SubElement(hsv_elem, 'H').text = str(record['hsv']['h'])
-            ET.SubElement(hsv_elem, 'S').text = str(record['hsv']['s'])
-            ET.SubElement(hsv_elem, 'V').text = str(record['hsv']['v'])
-        
-        # 写入文件
-        tree = ET.ElementTree(root)
-        ET.indent(tree, space="  ", level=0)
-        tree.write(file_path, encoding='utf-8', xml_declaration=True)
+            # 颜色记录
+            if not records:
+                f.write('  <Records />\n')
+            else:
+                f.write('  <Records>\n')
+                for i, (timestamp, file_id, x, y, r, g, b, hex_color, h, s, v) in enumerate(zip(
+                        records.formatted_timestamps(), records.file_ids, records.xs, records.ys,
+                        records.rs, records.gs, records.bs, records.hexes,
+                        records.hs, records.ss, records.vs), 1):
+                    f.write(template(i, timestamp, file_names[file_id], x, y, r, g, b, hex_color, h, s, v))
+                f.write('  </Records>\n')
+            f.write('</ColorRecords>')
     
     def export_to_txt(self, file_path):
         """导出为文本格式"""
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write("颜色记录导出文件\n")
-            f.write("=" * 50 + "\n")
-            f.write(f"导出时间: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-            f.write(f"记录总数: {len(self.color_records)}\n")
-            f.write("=" * 50 + "\n\n")
-            
-            for i, record in enumerate(self.color_records, 1):
-                f.write(f"记录 #{i}\n")
-                f.write(f"时间: {record['timestamp']}\n")
-                f.write(f"图像文件: {record['image_file']}\n")
-                f.write(f"位置: ({record['position']['x']}, {record['position']['y']})\n")
-                f.write(f"RGB: ({record['rgb']['r']}, {record['rgb']['g']}, {record['rgb']['b']})\n")
-                f.write(f"HSV: ({record['hsv']['h']}°, {record['hsv']['s']}%, {record['hsv']['v']}%)\n")
-                f.write(f"十六进制: {record['hex']}\n")
-                f.write("-" * 30 + "\n\n")
+        lines = [
+            "颜色记录导出文件\n",
+            "=" * 50 + "\n",
+            f"导出时间: {time.strftime('%Y-%m-%d %H:%M:%S')}\n",
+            f"记录总数: {len(self.color_records)}\n",
+            "=" * 50 + "\n\n"
+        ]
+        
+        # 每条记录按模板一次生成，直接读取各列，不再构造中间字典；最后一次写出
+        template = (
+            "记录 #{}\n时间: {}\n图像文件: {}\n位置: ({}, {})\n"
+            "RGB: ({}, {}, {})\nHSV: ({}°, {}%, {}%)\n十六进制: {}\n"
+            + "-" * 30 + "\n\n"
+        ).format
+        records = self.color_records
+        file_names = records.file_names
+        lines.extend(
+            template(i, timestamp, file_names[file_id], x, y, r, g, b, h, s, v, hex_color)
+            for i, (timestamp, file_id, x, y, r, g, b, h, s, v, hex_color) in enumerate(zip(
+                records.formatted_timestamps(), records.file_ids, records.xs, records.ys,
+                records.rs, records.gs, records.bs,
+                records.hs, records.ss, records.vs, records.hexes), 1)
+        )
+        
+        with open(file_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+            f.writelines(lines)
     
     def toggle_floating_mode(self):
         """切换悬浮窗模式"""
@@ -869,8 +1416,17 @@ class ImageColorPicker:
             self.is_floating_mode = True
             self.floating_btn.config(text="停止悬浮窗")
             
-            # 创建悬浮窗
+            # 创建悬浮窗（新窗口的控件需要重新显示位置和颜色）
             self.create_floating_window()
+            self.last_floating_position = None
+            self.last_floating_color = None
+            self.last_floating_sample = None
+            self.pending_capture = None
+            self.floating_idle_ticks = 0
+            # 屏幕尺寸在主线程读取，后台线程取色时不调用Tk
+            self.screen_size = (self.root.winfo_screenwidth(), self.root.winfo_screenheight())
+            # 只有Windows能直接读取单个像素；其他平台每次读取都要截屏，降低读取频率
+            self.min_grab_interval = 0.0 if platform.system() == "Windows" else 0.1
             
             # 隐藏主窗口（可选）
             self.root.withdraw()
@@ -891,6 +1447,14 @@ class ImageColorPicker:
         if self.floating_timer:
             self.root.after_cancel(self.floating_timer)
             self.floating_timer = None
+        # 丢弃尚未完成的后台取色结果
+        self.pending_capture = None
+        
+        # 取消通知的自动隐藏，通知窗口随悬浮窗一起销毁
+        if self.notification_after_id:
+            self.root.after_cancel(self.notification_after_id)
+            self.notification_after_id = None
+        self.notification_window = None
         
         # 关闭悬浮窗
         if self.floating_window:
@@ -931,21 +1495,21 @@ class ImageColorPicker:
     def setup_floating_ui(self):
         """设置悬浮窗界面"""
         # 主框架
-        padding = int(10 * self.ui_scale)
+        padding = self.spacing[10]
         main_frame = ttk.Frame(self.floating_window, padding=padding)
         main_frame.pack(fill=tk.BOTH, expand=True)
         
         # 标题
         title_label = ttk.Label(main_frame, text="屏幕取色器", font=self.fonts['title'])
-        title_label.pack(pady=(0, int(10 * self.ui_scale)))
+        title_label.pack(pady=(0, self.spacing[10]))
         
         # 鼠标位置显示
         self.mouse_pos_label = ttk.Label(main_frame, text="位置: (0, 0)", font=self.fonts['default'])
         self.mouse_pos_label.pack(anchor=tk.W)
         
         # 颜色信息框架
-        color_frame = ttk.LabelFrame(main_frame, text="颜色信息", padding=int(5 * self.ui_scale))
-        color_frame.pack(fill=tk.BOTH, expand=True, pady=(int(5 * self.ui_scale), 0))
+        color_frame = ttk.LabelFrame(main_frame, text="颜色信息", padding=self.spacing[5])
+        color_frame.pack(fill=tk.BOTH, expand=True, pady=(self.spacing[5], 0))
         
         # RGB显示
         self.floating_rgb_label = ttk.Label(color_frame, text="RGB: (0, 0, 0)", font=self.fonts['default'])
@@ -959,12 +1523,12 @@ class ImageColorPicker:
         preview_size = int(40 * self.ui_scale)
         self.floating_color_preview = tk.Frame(color_frame, width=preview_size, height=preview_size, 
                                               bg="black", relief=tk.SUNKEN, bd=2)
-        self.floating_color_preview.pack(pady=(int(5 * self.ui_scale), 0))
+        self.floating_color_preview.pack(pady=(self.spacing[5], 0))
         self.floating_color_preview.pack_propagate(False)
         
         # 按钮框架
         button_frame = ttk.Frame(main_frame)
-        button_frame.pack(fill=tk.X, pady=(int(10 * self.ui_scale), 0))
+        button_frame.pack(fill=tk.X, pady=(self.spacing[10], 0))
         
         # 取色按钮
         capture_btn = ttk.Button(button_frame, text="取色 (Ctrl+Click)", 
@@ -974,7 +1538,7 @@ class ImageColorPicker:
         # 关闭按钮
         close_btn = ttk.Button(button_frame, text="关闭", 
                               command=self.stop_floating_mode, style='Custom.TButton')
-        close_btn.pack(side=tk.RIGHT, padx=(int(5 * self.ui_scale), 0))
+        close_btn.pack(side=tk.RIGHT, padx=(self.spacing[5], 0))
         
         # 绑定全局热键
         self.floating_window.bind('<Control-Button-1>', self.on_floating_click)
@@ -985,54 +1549,105 @@ class ImageColorPicker:
         if self.is_floating_mode and self.floating_window:
             try:
                 # 获取鼠标位置
-                x = self.floating_window.winfo_pointerx()
-                y = self.floating_window.winfo_pointery()
+                x, y = self.floating_window.winfo_pointerxy()
+                moved = (x, y) != self.last_floating_position
                 
-                # 更新鼠标位置显示
-                if hasattr(self, 'mouse_pos_label'):
+                # 更新鼠标位置显示（位置未变化时跳过）
+                if moved:
                     self.mouse_pos_label.config(text=f"位置: ({x}, {y})")
+                    self.last_floating_position = (x, y)
+                    self.floating_idle_ticks = 0
+                else:
+                    self.floating_idle_ticks += 1
                 
-                # 捕获鼠标位置的颜色
-                try:
-                    # 使用PIL的ImageGrab捕获屏幕
-                    screenshot = ImageGrab.grab()
-                    
-                    # 确保坐标在屏幕范围内
-                    if 0 <= x < screenshot.width and 0 <= y < screenshot.height:
-                        # 获取像素颜色
-                        pixel_color = screenshot.getpixel((x, y))
-                        
-                        if len(pixel_color) >= 3:
-                            r, g, b = pixel_color[:3]
-                            
+                # 取回后台线程读取的像素（截屏较慢时不阻塞界面）
+                pending = self.pending_capture
+                if pending is not None and pending[3].done():
+                    self.pending_capture = None
+                    try:
+                        pixel_color = pending[3].result()
+                        self.last_floating_sample = pending[:3] + (pixel_color,)
+                        # 颜色未变化时（如在纯色区域移动）不必更新控件
+                        if pixel_color is not None and pixel_color != self.last_floating_color:
                             # 更新悬浮窗显示
-                            self.update_floating_display(r, g, b)
-                    
-                except Exception as e:
-                    print(f"屏幕捕获错误: {e}")
+                            self.update_floating_display(*pixel_color)
+                            self.last_floating_color = pixel_color
+                        
+                    except Exception as e:
+                        # 失败的读取也记为一次采样，按同样的间隔重试，不会每10毫秒重复截屏
+                        self.last_floating_sample = pending[:3] + (None,)
+                        print(f"屏幕捕获错误: {e}")
+                
+                # 先按鼠标移动速度决定读取像素的间隔：快速移动时约60Hz，一般移动时50毫秒；
+                # 鼠标静止时只需偶尔刷新（屏幕内容可能变化），每500毫秒读取一次
+                now = time.monotonic()
+                sample = self.last_floating_sample
+                stale = sample is None or sample[1:3] != (x, y)
+                if sample is None:
+                    wait = 0
+                elif stale:
+                    fast = max(abs(x - sample[1]), abs(y - sample[2])) > 32
+                    wait = max(0.016 if fast else 0.05, self.min_grab_interval) - (now - sample[0])
+                else:
+                    wait = 0.5 - (now - sample[0])
+                
+                if self.pending_capture is None and wait <= 0:
+                    # 在后台线程捕获鼠标位置的颜色
+                    future = self.capture_executor.submit(self.grab_screen_pixel, x, y)
+                    self.pending_capture = (now, x, y, future)
                 
-                # 继续捕获（每50毫秒更新一次）
-                self.floating_timer = self.root.after(50, self.start_screen_capture)
+                # 继续捕获：等待后台结果时10毫秒后再检查（只取回结果，不会重复截屏）；
+                # 显示的颜色落后于鼠标位置时，到下次允许读取的时间再检查；
+                # 鼠标静止越久检查间隔越长（最长200毫秒）
+                if self.pending_capture is not None:
+                    delay = 10
+                elif stale:
+                    delay = max(10, round(wait * 1000))
+                else:
+                    delay = min(200, 50 + 25 * self.floating_idle_ticks)
+                self.floating_timer = self.root.after(delay, self.start_screen_capture)
                 
             except Exception as e:
                 print(f"捕获循环错误: {e}")
                 self.stop_floating_mode()
     
+    def grab_screen_pixel(self, x, y):
+        """读取屏幕上单个像素的颜色，坐标不在屏幕上时返回None（可在后台线程调用）"""
+        if platform.system() == "Windows":
+            # ImageGrab在Windows上即使指定bbox也会先截取整个屏幕，直接用GDI读取单个像素
+            get_dc, release_dc, get_pixel = load_gdi_functions()
+            hdc = get_dc(None)
+            try:
+                color = get_pixel(hdc, x, y)
+            finally:
+                release_dc(None, hdc)
+            if color == 0xFFFFFFFF:  # CLR_INVALID
+                return None
+            # COLORREF的字节顺序为0x00BBGGRR
+            return color & 0xFF, (color >> 8) & 0xFF, (color >> 16) & 0xFF
+        
+        width, height = self.screen_size
+        if not (0 <= x < width and 0 <= y < height):
+            return None
+        # 其他平台仍通过ImageGrab截屏：macOS的screencapture只截取bbox区域，但每次都要启动子进程；
+        # Linux（X11）会先截取整个屏幕再裁剪，Wayland下调用外部截图工具。
+        # 因此悬浮窗在这些平台上按 min_grab_interval 限制读取频率
+        from PIL import ImageGrab  # 仅屏幕取色时用到，延迟导入以加快启动
+        pixel_color = ImageGrab.grab(bbox=(x, y, x + 1, y + 1)).getpixel((0, 0))
+        return pixel_color[:3]
+    
     def update_floating_display(self, r, g, b):
         """更新悬浮窗颜色显示"""
         try:
             # 更新RGB显示
-            if hasattr(self, 'floating_rgb_label'):
-                self.floating_rgb_label.config(text=f"RGB: ({r}, {g}, {b})")
+            self.floating_rgb_label.config(text=f"RGB: ({r}, {g}, {b})")
             
             # 更新十六进制显示
-            hex_color = f"#{r:02X}{g:02X}{b:02X}"
-            if hasattr(self, 'floating_hex_label'):
-                self.floating_hex_label.config(text=f"HEX: {hex_color}")
+            hex_color = "#" + HEX_TABLE[r] + HEX_TABLE[g] + HEX_TABLE[b]
+            self.floating_hex_label.config(text=f"HEX: {hex_color}")
             
             # 更新颜色预览
-            if hasattr(self, 'floating_color_preview'):
-                self.floating_color_preview.config(bg=hex_color)
+            self.floating_color_preview.config(bg=hex_color)
             
         except Exception as e:
             print(f"更新显示错误: {e}")
@@ -1041,45 +1656,28 @@ class ImageColorPicker:
         """手动捕获当前鼠标位置的颜色并记录"""
         try:
             # 获取当前鼠标位置
-            x = self.floating_window.winfo_pointerx()
-            y = self.floating_window.winfo_pointery()
+            x, y = self.floating_window.winfo_pointerxy()
             
-            # 捕获屏幕
-            screenshot = ImageGrab.grab()
-            
-            # 确保坐标在屏幕范围内
-            if 0 <= x < screenshot.width and 0 <= y < screenshot.height:
-                # 获取像素颜色
-                pixel_color = screenshot.getpixel((x, y))
+            # 悬浮窗刚在同一位置读取过像素时直接复用，记录的颜色也与悬浮窗显示的一致
+            sample = self.last_floating_sample
+            # （读取失败的采样不复用，重新读取以便提示错误）
+            if (sample is not None and sample[3] is not None and sample[1:3] == (x, y)
+                    and time.monotonic() - sample[0] < 0.1):
+                pixel_color = sample[3]
+            else:
+                pixel_color = self.grab_screen_pixel(x, y)
+            if pixel_color is not None:
+                r, g, b = pixel_color
                 
-                if len(pixel_color) >= 3:
-                    r, g, b = pixel_color[:3]
-                    
-                    # 计算HSV值
-                    h, s, v = colorsys.rgb_to_hsv(r/255.0, g/255.0, b/255.0)
-                    h_deg = int(h * 360)
-                    s_percent = int(s * 100)
-                    v_percent = int(v * 100)
-                    
-                    # 十六进制值
-                    hex_color = f"#{r:02X}{g:02X}{b:02X}"
-                    
-                    # 添加到颜色记录（标记为屏幕取色）
-                    record = {
-                        'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-                        'sequence': len(self.color_records) + 1,
-                        'position': {'x': x, 'y': y},
-                        'rgb': {'r': r, 'g': g, 'b': b},
-                        'hsv': {'h': h_deg, 's': s_percent, 'v': v_percent},
-                        'hex': hex_color,
-                        'image_file': 'Screen Capture'  # 标记为屏幕截图
-                    }
-                    
-                    self.color_records.append(record)
-                    self.update_record_count()
-                    
-                    # 显示成功提示
-                    self.show_capture_notification(hex_color)
+                # 计算十六进制值和HSV值
+                hex_color, h_deg, s_percent, v_percent = derive_color_values((r << 16) | (g << 8) | b)
+                
+                # 添加到颜色记录（标记为屏幕取色）
+                self.add_color_record(x, y, r, g, b, h_deg, s_percent, v_percent, hex_color,
+                                      image_file='Screen Capture')
+                
+                # 显示成功提示
+                self.show_capture_notification(hex_color)
                     
         except Exception as e:
             messagebox.showerror("错误", f"取色失败:\n{str(e)}")
@@ -1091,15 +1689,15 @@ class ImageColorPicker:
     def show_capture_notification(self, hex_color):
         """显示取色成功通知"""
         try:
-            # 创建临时通知窗口
-            notification = tk.Toplevel(self.floating_window)
-            notification.title("取色成功")
+            # 通知窗口只创建一次，之后只更新文字并重新显示
+            if self.notification_window is None:
+                self.create_capture_notification()
+            elif self.notification_after_id:
+                # 上一条通知还未隐藏，重新开始计时
+                self.root.after_cancel(self.notification_after_id)
             
-            # 窗口设置
-            notification.geometry("200x80")
-            notification.attributes('-topmost', True)
-            notification.attributes('-alpha', 0.8)
-            notification.resizable(False, False)
+            notification = self.notification_window
+            self.notification_label.config(text=f"已记录颜色\n{hex_color}")
             
             # 设置位置（悬浮窗下方）
             if self.floating_window:
@@ -1107,16 +1705,41 @@ class ImageColorPicker:
                 y = self.floating_window.winfo_y() + self.floating_window.winfo_height() + 10
                 notification.geometry(f"+{x}+{y}")
             
-            # 内容
-            label = ttk.Label(notification, text=f"已记录颜色\n{hex_color}", 
-                             font=self.fonts['default'], anchor=tk.CENTER)
-            label.pack(expand=True, fill=tk.BOTH, padx=10, pady=10)
+            notification.deiconify()
+            notification.lift()
             
-            # 自动关闭
-            notification.after(2000, notification.destroy)
+            # 自动隐藏
+            self.notification_after_id = self.root.after(2000, self.hide_capture_notification)
             
         except Exception as e:
             print(f"通知显示错误: {e}")
+    
+    def create_capture_notification(self):
+        """创建取色成功通知窗口（随悬浮窗一起销毁）"""
+        notification = tk.Toplevel(self.floating_window)
+        notification.title("取色成功")
+        
+        # 窗口设置
+        notification.geometry("200x80")
+        notification.attributes('-topmost', True)
+        notification.attributes('-alpha', 0.8)
+        notification.resizable(False, False)
+        # 点击标题栏关闭按钮时只隐藏窗口，下次取色继续复用
+        notification.protocol("WM_DELETE_WINDOW", self.hide_capture_notification)
+        
+        # 内容
+        self.notification_label = ttk.Label(notification, font=self.fonts['default'], anchor=tk.CENTER)
+        self.notification_label.pack(expand=True, fill=tk.BOTH, padx=10, pady=10)
+        
+        self.notification_window = notification
+    
+    def hide_capture_notification(self):
+        """隐藏取色成功通知"""
+        if self.notification_after_id:
+            self.root.after_cancel(self.notification_after_id)
+            self.notification_after_id = None
+        if self.notification_window:
+            self.notification_window.withdraw()
 
 def main():
     """主函数"""